@@ -0,0 +1,72 @@
+"""
+Checks that the Numba kernels, their fallbacks and PIL agree pixel for pixel
+"""
+
+import os
+import sys
+
+import numpy as np
+import pytest
+from PIL import Image, ImageEnhance, ImageFilter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app  # noqa: E402
+
+# Odd sizes, single rows/columns and sizes that don't line up with the
+# 64 pixel cartoon tiles
+SHAPES = [(1, 1), (1, 7), (7, 1), (2, 3), (3, 3), (5, 9), (67, 131), (130, 65)]
+
+needs_numba = pytest.mark.skipif(not app._HAVE_NUMBA, reason="Numba not installed")
+
+
+def _random_image(shape, seed=0):
+    """Return a random RGB image of the given (height, width) and its array"""
+    rng = np.random.default_rng(seed)
+    image = Image.fromarray(rng.integers(0, 256, shape + (3,), dtype=np.uint8))
+    return image, app._rgb_array(image)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_black_white_matches_pil(shape, monkeypatch):
+    image, rgb = _random_image(shape)
+    expected = np.asarray(image.convert("L").convert("RGB"))
+    
+    assert np.array_equal(np.asarray(app.ImageFilterApp._black_white(image, rgb)), expected)
+    monkeypatch.setattr(app, "_HAVE_NUMBA", False)
+    assert np.array_equal(np.asarray(app.ImageFilterApp._black_white(image, rgb)), expected)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_edge_detection_matches_pil(shape, monkeypatch):
+    image, rgb = _random_image(shape)
+    expected = np.asarray(image.convert("L").filter(ImageFilter.FIND_EDGES).convert("RGB"))
+    
+    assert np.array_equal(np.asarray(app.ImageFilterApp._edge_detection(image, rgb)), expected)
+    monkeypatch.setattr(app, "_HAVE_NUMBA", False)
+    assert np.array_equal(np.asarray(app.ImageFilterApp._edge_detection(image, rgb)), expected)
+
+
+@needs_numba
+@pytest.mark.parametrize("shape", SHAPES)
+def test_cartoon_kernel_matches_numpy_fallback(shape):
+    _, rgb = _random_image(shape)
+    kernel_out = np.empty_like(rgb)
+    numpy_out = np.empty_like(rgb)
+    app._cartoon_tile(rgb, kernel_out)
+    app._cartoon_numpy(rgb, numpy_out)
+    
+    assert np.array_equal(kernel_out, numpy_out)
+
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_cartoon_matches_pil_within_rounding(shape):
+    image, rgb = _random_image(shape)
+    posterized = Image.fromarray((rgb & 0xC0) | 0x20)
+    expected = np.asarray(
+        ImageEnhance.Color(posterized.filter(ImageFilter.EDGE_ENHANCE_MORE)).enhance(1.2)
+    )
+    
+    result = np.asarray(app.ImageFilterApp._cartoon(image, rgb))
+    # PIL blends in float, the kernels in exact integer math
+    assert np.abs(result.astype(int) - expected).max() <= 1